@@ -0,0 +1,110 @@
+"""
+Redis Cache Helpers
+
+Cache-aside layer for read-heavy endpoints. Set REDIS_URL to enable it; without
+it the decorated handlers simply run on every request.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+
+import redis.asyncio as redis
+from dotenv import load_dotenv
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from serialization import dumps
+
+# Load environment variables from .env file
+load_dotenv()
+
+redis_url = os.getenv("REDIS_URL")
+
+
+class Cache:
+    """Thin async wrapper around a Redis connection pool"""
+
+    def __init__(self, url: str = None):
+        self.url = url
+        self._pool = None
+        self._redis = None
+
+    async def connect(self):
+        if self.url and self._redis is None:
+            self._pool = redis.ConnectionPool.from_url(self.url)
+            self._redis = redis.Redis(connection_pool=self._pool)
+
+    async def disconnect(self):
+        if self._pool is not None:
+            await self._pool.disconnect()
+        self._pool = None
+        self._redis = None
+
+    async def get(self, key: str):
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except redis.RedisError:
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        if self._redis is None:
+            return
+        try:
+            await self._redis.setex(key, ttl, value)
+        except redis.RedisError:
+            pass
+
+    async def delete(self, key: str):
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(key)
+        except redis.RedisError:
+            pass
+
+    async def delete_pattern(self, pattern: str):
+        if self._redis is None:
+            return
+        try:
+            keys = [k async for k in self._redis.scan_iter(match=pattern)]
+            if keys:
+                await self._redis.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+cache = Cache(redis_url)
+
+
+def make_key(prefix: str, **params) -> str:
+    """Deterministic cache key from a prefix and the handler's arguments"""
+    if not params:
+        return prefix
+    digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=8).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def cached(prefix: str, ttl: int):
+    """Cache a JSON endpoint's response body in Redis for `ttl` seconds"""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            key = make_key(prefix, **kwargs)
+            body = await cache.get(key)
+            if body is None:
+                if inspect.iscoroutinefunction(fn):
+                    value = await fn(**kwargs)
+                else:
+                    value = await run_in_threadpool(fn, **kwargs)
+                body = value.body if isinstance(value, Response) else dumps(value)
+                await cache.set(key, body, ttl)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
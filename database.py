@@ -5,28 +5,88 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
-from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorClient
+from bson import ObjectId
+from bson.codec_options import TypeDecoder, TypeRegistry
+from datetime import datetime, timedelta, timezone
 import os
 from dotenv import load_dotenv
 from typing import Union
 from pydantic import BaseModel
+from pymongo.errors import DuplicateKeyError
+import logging
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 _client = None
 db = None
 
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
+class ObjectIdAsStr(TypeDecoder):
+    """Decode ObjectIds to hex strings so documents come back JSON-ready"""
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
 if database_url and database_name:
-    _client = MongoClient(database_url)
-    db = _client[database_name]
+    _client = AsyncIOMotorClient(database_url, maxPoolSize=100)
+    db = _client.get_database(
+        database_name,
+        codec_options=_client.codec_options.with_options(type_registry=TypeRegistry([ObjectIdAsStr()])),
+    )
+
+# (collection, keys, options), in build order: the indexes queries cannot run
+# without come first, the unique username index (which fails over legacy
+# duplicate astronauts) last
+INDEXES = [
+    # $text search in list_tips
+    ("tip", [("title", "text"), ("tags", "text")], {}),
+    # $merge target key for the leaderboard refresher
+    ("leaderboard_snapshot", [("period", 1), ("rank", 1)], {"unique": True}),
+    # leaderboard: equality on status, range on ended_at, then the grouped fields
+    ("session", [("status", 1), ("ended_at", -1), ("user", 1), ("points_earned", 1)], {}),
+    ("tip", [("category", 1)], {}),
+    ("astronaut", [("username", 1)], {"unique": True}),
+]
+
+async def ensure_indexes():
+    """Create the indexes the API queries rely on (no-op if they already exist)"""
+    if db is None:
+        return
+    # one failing build must not stop the others
+    for collection, keys, options in INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+        except Exception:
+            logger.exception("Creating index %s on %s failed", keys, collection)
+
+async def acquire_lease(name: str, ttl: int) -> bool:
+    """Take a named lease shared by every worker for `ttl` seconds; False while someone else holds it"""
+    now = datetime.now(timezone.utc)
+    try:
+        # matches only an expired lease; a live one makes the upsert collide on _id
+        await db["lease"].find_one_and_update(
+            {"_id": name, "expires_at": {"$lte": now}},
+            {"$set": {"expires_at": now + timedelta(seconds=ttl)}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+def close_client():
+    """Close the MongoDB client and its connection pool"""
+    if _client is not None:
+        _client.close()
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -37,13 +97,14 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
     else:
         data_dict = data.copy()
 
-    data_dict['created_at'] = datetime.now(timezone.utc)
-    data_dict['updated_at'] = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    data_dict['created_at'] = now
+    data_dict['updated_at'] = now
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
     """Get documents from collection"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -52,4 +113,4 @@ def get_documents(collection_name: str, filter_dict: dict = None, limit: int = N
     if limit:
         cursor = cursor.limit(limit)
     
-    return list(cursor)
+    return await cursor.to_list(length=limit)
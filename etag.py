@@ -0,0 +1,72 @@
+"""
+ETag Middleware
+
+Adds strong ETags and a per-path Cache-Control to GET responses on selected
+paths and answers matching If-None-Match requests with 304 Not Modified.
+"""
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+
+class ETagMiddleware:
+    """
+    Pure ASGI middleware. `paths` maps a path to the Cache-Control value sent
+    with it; paths are matched exactly, or as a prefix when they end with "/".
+    """
+
+    def __init__(self, app, paths: dict):
+        self.app = app
+        self.paths = dict(paths)
+
+    def _cache_control(self, path: str):
+        for p, cache_control in self.paths.items():
+            if path == p or (p.endswith("/") and path.startswith(p)):
+                return cache_control
+        return None
+
+    async def __call__(self, scope, receive, send):
+        cache_control = self._cache_control(scope["path"]) if scope["type"] == "http" else None
+        if cache_control is None or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        chunks = []
+
+        async def buffered_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if start["status"] != 200:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            headers = MutableHeaders(scope=start)
+            headers["etag"] = etag
+            headers["cache-control"] = cache_control
+
+            if_none_match = Headers(scope=scope).get("if-none-match", "")
+            candidates = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+            if etag in candidates or "*" in candidates:
+                del headers["content-length"]
+                del headers["content-type"]
+                start["status"] = 304
+                body = b""
+
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffered_send)
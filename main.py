@@ -1,41 +1,97 @@
+import asyncio
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Literal
+from functools import lru_cache
+from typing import Annotated, List, Optional, Literal
 
-from fastapi import FastAPI, HTTPException
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-
-from database import db, create_document, get_documents
+from fastapi.responses import Response
+from pymongo import ReturnDocument
+
+from cache import cache, cached, make_key
+from database import db, acquire_lease, close_client, create_document, ensure_indexes, get_documents
+from etag import ETagMiddleware
+from serialization import MongoJSONResponse, msgspec_body, msgspec_openapi
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await cache.connect()
+    tasks = []
+    if db is not None:
+        # built in the background so an unreachable database never blocks
+        # startup; /test still reports the problem
+        indexes = asyncio.create_task(ensure_indexes())
+        tasks.append(indexes)
+        tasks.append(asyncio.create_task(leaderboard_refresher(indexes)))
+    yield
+    for task in tasks:
+        task.cancel()
+    await cache.disconnect()
+    close_client()
+
+
+app = FastAPI(
+    title="Study Space Station API",
+    version="0.1.0",
+    default_response_class=MongoJSONResponse,
+    lifespan=lifespan,
+)
 
-app = FastAPI(title="Study Space Station API", version="0.1.0")
+# Comma-separated list of allowed origins; falls back to any origin (without
+# credentials) when unset, e.g. for local development
+frontend_origins = [o.strip() for o in os.getenv("FRONTEND_ORIGIN", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=frontend_origins or ["*"],
+    allow_credentials=bool(frontend_origins),
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
+# Read endpoints whose bodies rarely change between requests. Astronaut stats
+# change on every completed session, so clients must revalidate (and get a 304
+# when nothing changed) rather than reuse a stale copy.
+CACHED_ENDPOINTS = {
+    "/api/tips": "public, max-age=60",
+    "/api/playlists": "public, max-age=60",
+    "/api/achievements": "public, max-age=60",
+    "/api/astronaut/": "no-cache",
+}
+app.add_middleware(ETagMiddleware, paths=CACHED_ENDPOINTS)
+
 
 # ----------------------
-# Pydantic request models
+# Request models (msgspec, decoded from the raw body)
 # ----------------------
-class CompleteSessionRequest(BaseModel):
+class CompleteSessionRequest(msgspec.Struct):
     user: str
-    duration_min: int = Field(ge=1)
-    break_min: int = Field(ge=0, default=5)
+    duration_min: Annotated[int, msgspec.Meta(ge=1)]
+    break_min: Annotated[int, msgspec.Meta(ge=0)] = 5
     status: Literal["completed", "cancelled"] = "completed"
 
 
-class PlanRequest(BaseModel):
+class PlanRequest(msgspec.Struct):
     subject: str
-    timeframe_days: int = Field(ge=1, le=60)
-    daily_hours: float = Field(ge=0.5, le=12)
+    timeframe_days: Annotated[int, msgspec.Meta(ge=1, le=60)]
+    daily_hours: Annotated[float, msgspec.Meta(ge=0.5, le=12)]
     learning_style: Literal["visual", "auditory", "reading", "kinesthetic", "mixed"] = "mixed"
 
 
+CompleteSessionBody = Annotated[CompleteSessionRequest, Depends(msgspec_body(CompleteSessionRequest))]
+PlanBody = Annotated[PlanRequest, Depends(msgspec_body(PlanRequest))]
+
+
 # ----------------------
 # Helpers
 # ----------------------
@@ -43,58 +99,57 @@ POINTS_PER_MIN = 2  # base points per focus minute
 BONUS_COMPLETED = 25  # completion bonus for finished capsule
 
 
-def ensure_astronaut(username: str):
-    existing = list(db["astronaut"].find({"username": username}).limit(1)) if db else []
-    if existing:
-        return existing[0]
-    doc = {
-        "username": username,
-        "avatar": None,
-        "level": 1,
-        "xp": 0,
-        "streak": 0,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
-    }
-    inserted = db["astronaut"].insert_one(doc)
-    doc["_id"] = inserted.inserted_id
-    return doc
+async def ensure_astronaut(username: str, now: datetime):
+    """Fetch an astronaut, creating it with defaults on first sight (atomic upsert)"""
+    return await db["astronaut"].find_one_and_update(
+        {"username": username},
+        {"$setOnInsert": {
+            "avatar": None,
+            "level": 1,
+            "xp": 0,
+            "streak": 0,
+            "created_at": now,
+            "updated_at": now,
+        }},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
 
 
-def add_xp_and_level(username: str, delta_xp: int):
-    user = ensure_astronaut(username)
-    new_xp = int(user.get("xp", 0)) + int(delta_xp)
-    # simple leveling curve: level up every 250 xp
-    level = max(1, (new_xp // 250) + 1)
-    db["astronaut"].update_one(
+async def apply_session_progress(username: str, points: int, completed: bool, now: datetime):
+    """Add xp, recompute level and advance the streak in a single upsert"""
+    today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+    pipeline = [
+        {"$set": {
+            "avatar": {"$ifNull": ["$avatar", None]},
+            "xp": {"$add": [{"$ifNull": ["$xp", 0]}, points]},
+            "streak": {"$ifNull": ["$streak", 0]},
+            "created_at": {"$ifNull": ["$created_at", now]},
+            "updated_at": now,
+        }},
+        # simple leveling curve: level up every 250 xp
+        {"$set": {"level": {"$max": [1, {"$toInt": {"$add": [{"$floor": {"$divide": ["$xp", 250]}}, 1]}}]}}},
+    ]
+    if completed:
+        # streak increments if the last completed session was yesterday,
+        # holds if it was already counted today, and restarts otherwise
+        pipeline.append({"$set": {
+            "streak": {"$switch": {
+                "branches": [
+                    {"case": {"$gte": ["$last_completed_at", today]}, "then": {"$max": [1, "$streak"]}},
+                    {"case": {"$gte": ["$last_completed_at", today - timedelta(days=1)]}, "then": {"$add": ["$streak", 1]}},
+                ],
+                "default": 1,
+            }},
+            "last_completed_at": now,
+        }})
+    return await db["astronaut"].find_one_and_update(
         {"username": username},
-        {"$set": {"xp": new_xp, "level": level, "updated_at": datetime.now(timezone.utc)}},
+        pipeline,
+        projection={"_id": 0, "xp": 1, "level": 1, "streak": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
-    return {"xp": new_xp, "level": level}
-
-
-def update_streak(username: str):
-    # streak increments if last session not older than yesterday
-    today = datetime.now(timezone.utc).date()
-    last = db["session"].find({"user": username, "status": "completed"}).sort("ended_at", -1).limit(1)
-    last_dt = None
-    for l in last:
-        last_dt = l.get("ended_at")
-    user = ensure_astronaut(username)
-    current_streak = int(user.get("streak", 0))
-    if last_dt:
-        last_date = last_dt.date() if isinstance(last_dt, datetime) else today
-        if last_date == today:
-            # already counted today
-            return current_streak
-        if last_date == today - timedelta(days=1):
-            current_streak += 1
-        else:
-            current_streak = 1
-    else:
-        current_streak = 1
-    db["astronaut"].update_one({"username": username}, {"$set": {"streak": current_streak}})
-    return current_streak
 
 
 # ----------------------
@@ -105,8 +160,27 @@ def root():
     return {"service": "Study Space Station API", "status": "ok"}
 
 
+@app.get("/healthz")
+def healthz():
+    # liveness/readiness probe target; deliberately does no I/O
+    return {"status": "ok"}
+
+
+COLLECTIONS_TTL_SECONDS = 30
+_collections_cache = (0.0, [])  # (expires_at, names)
+
+
+async def list_collections_cached():
+    global _collections_cache
+    expires_at, names = _collections_cache
+    if time.monotonic() >= expires_at:
+        names = await db.list_collection_names()
+        _collections_cache = (time.monotonic() + COLLECTIONS_TTL_SECONDS, names)
+    return names
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     info = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -115,7 +189,7 @@ def test_database():
     try:
         if db is not None:
             info["database"] = "✅ Connected"
-            info["collections"] = db.list_collection_names()
+            info["collections"] = await list_collections_cached()
     except Exception as e:
         info["database"] = f"⚠️ {str(e)[:80]}"
     return info
@@ -125,76 +199,85 @@ def test_database():
 # Knowledge Vault (Tips)
 # ----------------------
 @app.get("/api/tips")
-def list_tips(category: Optional[str] = None, q: Optional[str] = None, limit: int = 24):
+@cached("tips", ttl=60)
+async def list_tips(
+    category: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: int = Query(24, ge=1, le=100),
+):
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
     filt = {}
     if category:
         filt["category"] = category
     if q:
-        filt["$or"] = [{"title": {"$regex": q, "$options": "i"}}, {"tags": {"$in": [q]}}]
-    docs = list(db["tip"].find(filt).limit(limit))
-    for d in docs:
-        d["_id"] = str(d["_id"])  # jsonify
+        # served by the title/tags text index
+        filt["$text"] = {"$search": q}
+    cursor = db["tip"].find(filt, {"title": 1, "category": 1, "tags": 1, "tiktok_url": 1}).limit(limit)
+    if q:
+        cursor = cursor.sort([("score", {"$meta": "textScore"})])
+    docs = await cursor.to_list(length=limit)
     return {"items": docs}
 
 
 @app.get("/api/tips/random")
-def random_tip(category: Optional[str] = None):
+async def random_tip(category: Optional[str] = None):
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
     pipeline = []
     if category:
         pipeline.append({"$match": {"category": category}})
     pipeline.append({"$sample": {"size": 1}})
-    sampled = list(db["tip"].aggregate(pipeline))
+    sampled = await db["tip"].aggregate(pipeline).to_list(length=1)
     if not sampled:
         raise HTTPException(status_code=404, detail="No tips found")
-    tip = sampled[0]
-    tip["_id"] = str(tip["_id"])
-    return tip
+    # returned as a response to skip jsonable_encoder
+    return MongoJSONResponse(sampled[0])
 
 
 # ----------------------
 # Orbit Radio (Playlists)
 # ----------------------
+DEFAULT_PLAYLISTS = [
+    {
+        "name": "Lofi",
+        "description": "Chill beats for deep focus.",
+        "cover": None,
+        "tracks": [],
+    },
+    {
+        "name": "Ambient",
+        "description": "Soft textures and cosmic drones.",
+        "cover": None,
+        "tracks": [],
+    },
+    {
+        "name": "Nature",
+        "description": "Rain, wind, and distant thunder.",
+        "cover": None,
+        "tracks": [],
+    },
+]
+_DEFAULT_PLAYLISTS_BYTES = orjson.dumps({"items": DEFAULT_PLAYLISTS})
+
+
 @app.get("/api/playlists")
-def playlists():
+@cached("playlists", ttl=600)
+async def playlists():
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
-    docs = list(db["playlist"].find({}))
-    for d in docs:
-        d["_id"] = str(d["_id"])  # jsonify
+    docs = await db["playlist"].find({}).to_list(length=None)
     # Provide safe defaults if collection empty
     if not docs:
-        docs = [
-            {
-                "name": "Lofi",
-                "description": "Chill beats for deep focus.",
-                "cover": None,
-                "tracks": [],
-            },
-            {
-                "name": "Ambient",
-                "description": "Soft textures and cosmic drones.",
-                "cover": None,
-                "tracks": [],
-            },
-            {
-                "name": "Nature",
-                "description": "Rain, wind, and distant thunder.",
-                "cover": None,
-                "tracks": [],
-            },
-        ]
+        return Response(content=_DEFAULT_PLAYLISTS_BYTES, media_type="application/json")
     return {"items": docs}
 
 
 # ----------------------
 # Focus Capsule (Sessions + Points)
 # ----------------------
-@app.post("/api/sessions/complete")
-def complete_session(payload: CompleteSessionRequest):
+@app.post("/api/sessions/complete", openapi_extra=msgspec_openapi(CompleteSessionRequest))
+async def complete_session(payload: CompleteSessionBody):
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
     now = datetime.now(timezone.utc)
@@ -213,98 +296,176 @@ def complete_session(payload: CompleteSessionRequest):
         "created_at": now,
         "updated_at": now,
     }
-    sid = db["session"].insert_one(session_doc).inserted_id
+    # Session insert and XP / level / streak upsert are independent; run them concurrently
+    inserted, user = await asyncio.gather(
+        db["session"].insert_one(session_doc),
+        apply_session_progress(payload.user, points, payload.status == "completed", now),
+    )
+    sid = inserted.inserted_id
 
-    # Update XP / Level
-    stats = add_xp_and_level(payload.user, points)
-    # Update streak when completed
-    streak = update_streak(payload.user) if payload.status == "completed" else ensure_astronaut(payload.user).get("streak", 0)
+    # Drop cached reads that this write just made stale
+    await cache.delete(make_key("astronaut", username=payload.user))
 
     return {
         "session_id": str(sid),
         "points": points,
-        "xp": stats["xp"],
-        "level": stats["level"],
-        "streak": streak,
+        "xp": int(user["xp"]),
+        "level": int(user["level"]),
+        "streak": int(user["streak"]),
     }
 
 
+LEADERBOARD_SIZE = 100  # ranks kept per period in leaderboard_snapshot
+LEADERBOARD_REFRESH_SECONDS = 60
+_leaderboard_snapshot_ready = False  # set once this process has refreshed the snapshot
+
+
+# Stages shared by every leaderboard run; only $match and $limit vary
+_LB_BASE_MATCH = {"status": "completed"}
+_LB_GROUP_STAGES = [
+    # narrow to the grouped fields so the index covers the scan and $group hashes less
+    {"$project": {"_id": 0, "user": 1, "points_earned": 1}},
+    {"$group": {"_id": "$user", "points": {"$sum": "$points_earned"}}},
+    {"$sort": {"points": -1}},
+]
+_LB_SHAPE_STAGES = [
+    # attach each user's level server-side instead of one find_one per row
+    {"$lookup": {
+        "from": "astronaut",
+        "localField": "_id",
+        "foreignField": "username",
+        "as": "a",
+        "pipeline": [{"$project": {"_id": 0, "level": 1}}],
+    }},
+    {"$addFields": {"level": {"$ifNull": [{"$arrayElemAt": ["$a.level", 0]}, 1]}}},
+    {"$project": {"_id": 0, "username": "$_id", "points": 1, "level": 1}},
+]
+
+
+def leaderboard_pipeline(period: str, limit: int, now: datetime):
+    if period == "week":
+        match = {**_LB_BASE_MATCH, "ended_at": {"$gte": now - timedelta(days=7)}}
+    else:
+        match = _LB_BASE_MATCH
+    return [{"$match": match}, *_LB_GROUP_STAGES, {"$limit": limit}, *_LB_SHAPE_STAGES]
+
+
+async def refresh_leaderboard_snapshot():
+    """Materialize the top LEADERBOARD_SIZE ranks of each period into leaderboard_snapshot"""
+    global _leaderboard_snapshot_ready
+    refreshed_at = datetime.now(timezone.utc)
+    for period in ("week", "all"):
+        pipeline = leaderboard_pipeline(period, LEADERBOARD_SIZE, refreshed_at) + [
+            {"$setWindowFields": {"sortBy": {"points": -1}, "output": {"rank": {"$documentNumber": {}}}}},
+            {"$addFields": {"period": period, "refreshed_at": refreshed_at}},
+            {"$merge": {
+                "into": "leaderboard_snapshot",
+                "on": ["period", "rank"],
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }},
+        ]
+        await db["session"].aggregate(pipeline).to_list(length=None)
+        # ranks past the ones this run wrote belong to an earlier, longer board
+        last = await db["leaderboard_snapshot"].find_one(
+            {"period": period, "refreshed_at": refreshed_at}, {"_id": 0, "rank": 1}, sort=[("rank", -1)]
+        )
+        written = last["rank"] if last else 0
+        await db["leaderboard_snapshot"].delete_many({"period": period, "rank": {"$gt": written}})
+    _leaderboard_snapshot_ready = True
+    # cached boards only go stale when the snapshot they were read from changes
+    await cache.delete_pattern("leaderboard:*")
+
+
+async def leaderboard_refresher(indexes: asyncio.Task):
+    # every worker runs this loop, but the Mongo lease lets only one of them
+    # refresh per interval; $merge needs the unique (period, rank) index first
+    await indexes
+    while True:
+        try:
+            if await acquire_lease("leaderboard_refresh", LEADERBOARD_REFRESH_SECONDS):
+                await refresh_leaderboard_snapshot()
+        except Exception:
+            logger.exception("Leaderboard snapshot refresh failed")
+        await asyncio.sleep(LEADERBOARD_REFRESH_SECONDS)
+
+
 @app.get("/api/leaderboard")
-def leaderboard(period: Literal["week", "all"] = "week", limit: int = 10):
+@cached("leaderboard", ttl=30)
+async def leaderboard(
+    period: Literal["week", "all"] = "week",
+    limit: int = Query(10, ge=1, le=LEADERBOARD_SIZE),
+):
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
-    filt = {"status": "completed"}
-    if period == "week":
-        since = datetime.now(timezone.utc) - timedelta(days=7)
-        filt["ended_at"] = {"$gte": since}
-    pipeline = [
-        {"$match": filt},
-        {"$group": {"_id": "$user", "points": {"$sum": "$points_earned"}}},
-        {"$sort": {"points": -1}},
-        {"$limit": limit},
-    ]
-    rows = list(db["session"].aggregate(pipeline))
-    items = []
-    for r in rows:
-        user = db["astronaut"].find_one({"username": r["_id"]}) or {"level": 1}
-        items.append({
-            "username": r["_id"],
-            "points": int(r["points"]),
-            "level": int(user.get("level", 1)),
-        })
+    items = await db["leaderboard_snapshot"].find(
+        {"period": period}, {"_id": 0, "username": 1, "points": 1, "level": 1}
+    ).sort("rank", 1).limit(limit).to_list(length=limit)
+    # an empty but refreshed snapshot is a genuinely empty board
+    if items or _leaderboard_snapshot_ready:
+        return {"items": items}
+    # snapshot not built yet
+    pipeline = leaderboard_pipeline(period, limit, datetime.now(timezone.utc))
+    items = await db["session"].aggregate(pipeline).to_list(length=limit)
     return {"items": items}
 
 
 @app.get("/api/astronaut/{username}")
-def get_astronaut(username: str):
+@cached("astronaut", ttl=30)
+async def get_astronaut(username: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Database unavailable")
-    user = db["astronaut"].find_one({"username": username})
+    user = await db["astronaut"].find_one({"username": username})
     if not user:
-        user = ensure_astronaut(username)
-    user["_id"] = str(user.get("_id")) if user.get("_id") else None
+        user = await ensure_astronaut(username, datetime.now(timezone.utc))
     return user
 
 
 # ----------------------
 # Mission Planner (Study Plan Generator)
 # ----------------------
-@app.post("/api/plan")
-def generate_plan(req: PlanRequest):
+STUDY_METHODS = {
+    "visual": ("Mind maps", "Diagram study", "Color-coded notes"),
+    "auditory": ("Explain aloud", "Podcast recap", "Record and replay"),
+    "reading": ("SQ3R method", "Active recall", "Cornell notes"),
+    "kinesthetic": ("Practice questions", "Teach a friend", "Flashcards walk"),
+    "mixed": ("Pomodoro x5", "Blurting", "Spaced repetition"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _plan_day(subject: str, daily_hours: float, learning_style: str):
+    """Goal and focus blocks for one day; identical for every day of a plan"""
+    blocks = max(1, int(daily_hours // 0.5))  # 30m blocks
+    methods = STUDY_METHODS.get(learning_style, STUDY_METHODS["mixed"])
+    goal = f"{subject}: {int(daily_hours*60)} min focus"
+    return goal, tuple(
+        {"label": f"Focus Block {b+1}", "minutes": 30, "method": methods[b % len(methods)]}
+        for b in range(blocks)
+    )
+
+
+@app.post("/api/plan", openapi_extra=msgspec_openapi(PlanRequest))
+async def generate_plan(req: PlanBody):
     # simple heuristic plan generator
     days = req.timeframe_days
     per_day_hours = req.daily_hours
-    blocks = max(1, int(per_day_hours // 0.5))  # 30m blocks
-    style_map = {
-        "visual": ["Mind maps", "Diagram study", "Color-coded notes"],
-        "auditory": ["Explain aloud", "Podcast recap", "Record and replay"],
-        "reading": ["SQ3R method", "Active recall", "Cornell notes"],
-        "kinesthetic": ["Practice questions", "Teach a friend", "Flashcards walk"],
-        "mixed": ["Pomodoro x5", "Blurting", "Spaced repetition"],
-    }
-    methods = style_map.get(req.learning_style, style_map["mixed"])
+    goal, blocks = _plan_day(req.subject, per_day_hours, req.learning_style)
 
     start = datetime.now(timezone.utc).date()
-    schedule = []
-    for i in range(days):
-        date = start + timedelta(days=i)
-        day_plan = {
-            "date": date.isoformat(),
-            "goal": f"{req.subject}: {int(per_day_hours*60)} min focus",
-            "blocks": [
-                {"label": f"Focus Block {b+1}", "minutes": 30, "method": methods[b % len(methods)]}
-                for b in range(blocks)
-            ],
-        }
-        schedule.append(day_plan)
+    schedule = [
+        {"date": (start + timedelta(days=i)).isoformat(), "goal": goal, "blocks": blocks}
+        for i in range(days)
+    ]
 
-    return {
+    # returned as a response so the shared block dicts skip jsonable_encoder
+    return MongoJSONResponse({
         "subject": req.subject,
         "learning_style": req.learning_style,
         "daily_hours": per_day_hours,
         "timeframe_days": days,
         "schedule": schedule,
-    }
+    })
 
 
 # ----------------------
@@ -316,13 +477,31 @@ ACHIEVEMENTS = [
     {"key": "streak_7", "name": "One Week Orbit", "description": "Maintain a 7-day streak."},
 ]
 
+# Serialized once; the list never changes at runtime
+_ACHIEVEMENTS_BYTES = orjson.dumps({"items": ACHIEVEMENTS})
+
 
 @app.get("/api/achievements")
 def list_achievements():
-    return {"items": ACHIEVEMENTS}
+    return Response(content=_ACHIEVEMENTS_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
-    import uvicorn
+    import sys
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    cpus = os.cpu_count() or 1
+    workers = int(os.getenv("WEB_CONCURRENCY", cpus))
+    # Motor sizes its PyMongo thread pool from MOTOR_MAX_WORKERS when it is
+    # first imported, and this process already has; re-exec so every server
+    # process starts with it set. Only ever raise it above Motor's default.
+    os.environ.setdefault("MOTOR_MAX_WORKERS", str(max(64, cpus * 5)))
+    os.execv(sys.executable, [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--app-dir", os.path.dirname(os.path.abspath(__file__)),
+        "--host", "0.0.0.0",
+        "--port", str(port),
+        "--workers", str(workers),
+        "--loop", "uvloop",
+        "--http", "httptools",
+        "--no-access-log",
+    ])
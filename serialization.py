@@ -0,0 +1,86 @@
+"""
+JSON Serialization Helpers
+
+orjson-backed encoding for MongoDB documents (datetimes are handled natively by
+orjson; ObjectIds are rendered as strings) and msgspec-backed request decoding.
+"""
+
+import re
+
+import msgspec
+import orjson
+from bson import ObjectId
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+
+
+def _default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(value) -> bytes:
+    """Encode a value (Mongo documents included) to JSON bytes"""
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also understands BSON ObjectIds"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+_ERROR_PATH = re.compile(r" - at `\$(.*)`$")
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD = re.compile(r"^Object missing required field `(.+)`$")
+
+
+def _validation_error(e: Exception) -> dict:
+    """Translate a msgspec error into one FastAPI-style {loc, msg, type} entry"""
+    msg = str(e)
+    loc = ["body"]
+    # ValidationError subclasses DecodeError; only the latter means malformed JSON
+    if not isinstance(e, msgspec.ValidationError):
+        return {"loc": tuple(loc), "msg": msg, "type": "json_invalid"}
+    # msgspec reports the offending field as a JSON path suffix, e.g. " - at `$.duration_min`"
+    path = _ERROR_PATH.search(msg)
+    if path:
+        msg = msg[:path.start()]
+        for key, index in _PATH_PART.findall(path.group(1)):
+            loc.append(key if key else int(index))
+    missing = _MISSING_FIELD.match(msg)
+    if missing:
+        loc.append(missing.group(1))
+        return {"loc": tuple(loc), "msg": "Field required", "type": "missing"}
+    return {"loc": tuple(loc), "msg": msg, "type": "value_error"}
+
+
+def msgspec_body(model: type):
+    """FastAPI dependency that decodes the raw request body straight into a msgspec.Struct"""
+    decoder = msgspec.json.Decoder(model)
+
+    async def dependency(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            # same 422 shape FastAPI produces for Pydantic bodies
+            raise RequestValidationError([_validation_error(e)])
+
+    return dependency
+
+
+def msgspec_openapi(model: type) -> dict:
+    """
+    `openapi_extra` documenting a msgspec body, since FastAPI cannot see through
+    msgspec_body. The model's schema is inlined, so it must not nest other Structs.
+    """
+    (_,), components = msgspec.json.schema_components([model], ref_template="#/components/schemas/{name}")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}},
+        }
+    }
@@ -15,5 +15,8 @@ mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
 echo "Starting FastAPI server..."
+# Motor's own PyMongo thread pool defaults to cpu_count * 5 threads; raise it to at least 64
+CPUS=$(nproc)
+export MOTOR_MAX_WORKERS=${MOTOR_MAX_WORKERS:-$(( CPUS * 5 > 64 ? CPUS * 5 : 64 ))}
 nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
 echo "Server started in background"
@@ -0,0 +1,52 @@
+import asyncio
+
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from cache import cache, cached, make_key
+
+
+def test_make_key_is_deterministic_and_order_independent():
+    assert make_key("tips", category="Focus", q=None, limit=24) == make_key("tips", limit=24, q=None, category="Focus")
+    assert make_key("tips", limit=24) != make_key("tips", limit=25)
+    assert make_key("tips", limit=24).startswith("tips:")
+    assert make_key("playlists") == "playlists"
+
+
+def test_cached_runs_handler_every_time_without_redis():
+    assert cache._redis is None
+    calls = []
+
+    @cached("test", ttl=60)
+    def handler(limit: int):
+        calls.append(limit)
+        return {"items": [limit], "_id": ObjectId("0123456789abcdef01234567")}
+
+    first = asyncio.run(handler(limit=3))
+    second = asyncio.run(handler(limit=3))
+    assert calls == [3, 3]
+    assert isinstance(first, Response)
+    assert first.body == second.body == b'{"items":[3],"_id":"0123456789abcdef01234567"}'
+
+
+def test_cached_passes_prebuilt_response_bodies_through():
+    @cached("test", ttl=60)
+    async def handler():
+        return Response(content=b'{"items":[]}', media_type="application/json")
+
+    assert asyncio.run(handler()).body == b'{"items":[]}'
+
+
+def test_cached_endpoint_keeps_its_query_parameters():
+    app = FastAPI()
+
+    @app.get("/items")
+    @cached("items", ttl=60)
+    async def items(limit: int = 10):
+        return {"limit": limit}
+
+    client = TestClient(app)
+    assert client.get("/items", params={"limit": 5}).json() == {"limit": 5}
+    assert client.get("/items", params={"limit": "x"}).status_code == 422
@@ -0,0 +1,86 @@
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from etag import ETagMiddleware
+
+
+def _ok(request):
+    return JSONResponse({"items": [1, 2, 3]})
+
+
+def _missing(request):
+    return JSONResponse({"detail": "nope"}, status_code=404)
+
+
+def make_client():
+    app = Starlette(routes=[
+        Route("/api/tips", _ok),
+        Route("/api/tips/random", _ok),
+        Route("/api/astronaut/{username}", _ok),
+        Route("/api/gone", _missing),
+        Route("/api/post", _ok, methods=["POST"]),
+    ])
+    app.add_middleware(ETagMiddleware, paths={
+        "/api/tips": "public, max-age=60",
+        "/api/astronaut/": "no-cache",
+        "/api/gone": "public, max-age=60",
+        "/api/post": "public, max-age=60",
+    })
+    return TestClient(app)
+
+
+def test_sets_etag_and_path_cache_control():
+    client = make_client()
+    tips = client.get("/api/tips")
+    assert tips.status_code == 200
+    assert tips.headers["etag"].startswith('"')
+    assert tips.headers["cache-control"] == "public, max-age=60"
+
+    astronaut = client.get("/api/astronaut/bob")
+    assert astronaut.headers["cache-control"] == "no-cache"
+
+
+def test_exact_paths_do_not_match_as_prefix():
+    assert "etag" not in make_client().get("/api/tips/random").headers
+
+
+def test_matching_if_none_match_returns_304():
+    client = make_client()
+    etag = client.get("/api/tips").headers["etag"]
+    r = client.get("/api/tips", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+    assert "content-type" not in r.headers
+
+
+def test_weak_and_listed_validators_match():
+    client = make_client()
+    etag = client.get("/api/tips").headers["etag"]
+    assert client.get("/api/tips", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get("/api/tips", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+
+
+def test_wildcard_matches():
+    assert make_client().get("/api/tips", headers={"If-None-Match": "*"}).status_code == 304
+
+
+def test_stale_validator_gets_full_body():
+    r = make_client().get("/api/tips", headers={"If-None-Match": '"stale"'})
+    assert r.status_code == 200
+    assert r.json() == {"items": [1, 2, 3]}
+
+
+def test_non_200_passes_through():
+    r = make_client().get("/api/gone", headers={"If-None-Match": "*"})
+    assert r.status_code == 404
+    assert "etag" not in r.headers
+    assert r.json() == {"detail": "nope"}
+
+
+def test_non_get_passes_through():
+    r = make_client().post("/api/post")
+    assert r.status_code == 200
+    assert "etag" not in r.headers
@@ -0,0 +1,62 @@
+from typing import Annotated, List
+
+import msgspec
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from serialization import msgspec_body, msgspec_openapi
+
+
+class Item(msgspec.Struct):
+    name: str
+    qty: Annotated[int, msgspec.Meta(ge=1)]
+    tags: List[str] = []
+
+
+def make_client():
+    app = FastAPI()
+
+    @app.post("/items", openapi_extra=msgspec_openapi(Item))
+    async def create(item: Annotated[Item, Depends(msgspec_body(Item))]):
+        return {"name": item.name, "qty": item.qty}
+
+    return TestClient(app)
+
+
+def test_decodes_valid_body():
+    r = make_client().post("/items", json={"name": "pen", "qty": 2})
+    assert r.status_code == 200
+    assert r.json() == {"name": "pen", "qty": 2}
+
+
+def test_constraint_error_reports_field_location():
+    r = make_client().post("/items", json={"name": "pen", "qty": 0})
+    assert r.status_code == 422
+    assert r.json() == {"detail": [{"loc": ["body", "qty"], "msg": "Expected `int` >= 1", "type": "value_error"}]}
+
+
+def test_missing_field():
+    r = make_client().post("/items", json={"name": "pen"})
+    assert r.status_code == 422
+    assert r.json()["detail"] == [{"loc": ["body", "qty"], "msg": "Field required", "type": "missing"}]
+
+
+def test_nested_path_includes_index():
+    r = make_client().post("/items", json={"name": "pen", "qty": 1, "tags": ["a", 2]})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "tags", 1]
+
+
+def test_malformed_json():
+    r = make_client().post("/items", content=b"{oops")
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body"]
+    assert r.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_request_body_is_published_in_openapi():
+    body = make_client().get("/openapi.json").json()["paths"]["/items"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    assert body["required"] is True
+    assert schema["required"] == ["name", "qty"]
+    assert schema["properties"]["qty"]["minimum"] == 1